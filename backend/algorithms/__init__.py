@@ -3,17 +3,46 @@ Compression Algorithms Module
 Contains implementations of Fibonacci, Huffman, and LZW coding algorithms
 """
 
-from .fibonacci_coding import fib_encode, fib_decode, compress_dataset, decompress_dataset
-from .huffman_coding import huffman_compress, huffman_decompress
-from .lzw_coding import lzw_compress, lzw_decompress
+from .fibonacci_coding import (
+    fib_encode,
+    fib_encode_int,
+    fib_encode_mask,
+    fib_encode_bytes,
+    fib_encode_batch,
+    fib_decode,
+    largest_fib,
+    compress_dataset,
+    decompress_dataset,
+    compress_dataset_bytes,
+    decompress_dataset_bytes
+)
+from .huffman_coding import (
+    huffman_compress,
+    huffman_decompress,
+    huffman_decompress_canonical,
+    huffman_compress_bytes,
+    huffman_decompress_bytes
+)
+from .lzw_coding import lzw_compress, lzw_decompress, numbers_to_ascii
 
 __all__ = [
     'fib_encode',
+    'fib_encode_int',
+    'fib_encode_mask',
+    'fib_encode_bytes',
+    'fib_encode_batch',
     'fib_decode',
+    'largest_fib',
     'compress_dataset',
     'decompress_dataset',
+    'compress_dataset_bytes',
+    'decompress_dataset_bytes',
     'huffman_compress',
     'huffman_decompress',
+    'huffman_decompress_canonical',
+    'huffman_compress_bytes',
+    'huffman_decompress_bytes',
     'lzw_compress',
-    'lzw_decompress'
+    'lzw_decompress',
+    'numbers_to_ascii'
 ]
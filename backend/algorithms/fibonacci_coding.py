@@ -7,6 +7,105 @@ References:
 - Fraenkel, A. S., & Klein, S. T. (1996). Robust universal complete codes
 """
 
+import math
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; pure-Python loops are used instead
+    njit = None
+
+
+def _build_fib_table(limit):
+    """
+    Build the Fibonacci sequence 1, 2, 3, 5, 8, ... up to (and one past) limit
+    
+    Args:
+        limit (int): Value the last Fibonacci number must exceed
+        
+    Returns:
+        list: Fibonacci numbers, the last one being > limit
+    """
+    fibs = []
+    a, b = 1, 2
+    
+    while a <= limit:
+        fibs.append(a)
+        a, b = b, a + b
+    fibs.append(a)
+    
+    return fibs
+
+
+# Precomputed Fibonacci table covering every 64-bit integer (~93 entries).
+# Built once at import so encode/decode never regenerate the sequence.
+_FIBS = _build_fib_table(1 << 64)
+
+# Datasets at least this long are encoded with the vectorized NumPy path
+_VECTORIZE_MIN_SIZE = 64
+
+# Codeword strings memoized by fib_encode, shared across calls and requests
+_CODE_CACHE_SIZE = 1 << 16
+
+
+# ================================================
+# OPTIONAL NUMBA KERNELS
+# ================================================
+
+# Codewords whose bitmask fits in a signed 64-bit integer
+_NB_MAX_BITS = 63
+_NB_LIMIT = _FIBS[_NB_MAX_BITS]
+
+if njit is not None:
+    _FIBS_NB = np.array(_FIBS[:_NB_MAX_BITS], dtype=np.int64)
+
+    @njit(cache=True)
+    def _fib_encode_nb(n, fibs):
+        """Greedy Zeckendorf loop; returns (mask, bitlen) with bitlen excluding the terminator"""
+        i = len(fibs) - 1
+        while fibs[i] > n:
+            i -= 1
+        bitlen = i + 1
+        mask = 0
+        remainder = n
+        while remainder > 0 and i >= 0:
+            if remainder >= fibs[i]:
+                mask |= 1 << i
+                remainder -= fibs[i]
+            i -= 1
+        return mask, bitlen
+
+    @njit(cache=True)
+    def _fib_decode_nb(mask, bitlen, fibs):
+        """Sum the Fibonacci numbers selected by the set bits of mask"""
+        result = 0
+        for i in range(bitlen):
+            if (mask >> i) & 1:
+                result += fibs[i]
+        return result
+else:
+    _fib_encode_nb = None
+    _fib_decode_nb = None
+
+
+def _fib_table(count):
+    """
+    Return a Fibonacci table with at least ``count`` entries
+    
+    Uses the shared precomputed table when it is long enough and only
+    extends a private copy for codewords beyond the 64-bit range.
+    """
+    if count <= len(_FIBS):
+        return _FIBS
+    
+    fibs = list(_FIBS)
+    while len(fibs) < count:
+        fibs.append(fibs[-1] + fibs[-2])
+    return fibs
+
 
 def generate_fibs(n):
     """
@@ -28,14 +127,118 @@ def generate_fibs(n):
     if n < 1:
         return []
     
-    fibs = []
-    a, b = 1, 2
+    if n < _FIBS[-1]:
+        return _FIBS[:bisect_right(_FIBS, n)]
     
-    while a <= n:
-        fibs.append(a)
-        a, b = b, a + b
+    # Beyond the precomputed table
+    return _build_fib_table(n)[:-1]
+
+
+def _fib_pair(k):
+    """
+    Return (F(k), F(k+1)) of the standard sequence (F(0) = 0) by fast doubling
     
-    return fibs
+    Uses F(2m) = F(m) * (2F(m+1) - F(m)) and F(2m+1) = F(m)^2 + F(m+1)^2,
+    walking the bits of k from the top: O(log k) big-integer operations
+    instead of k additions.
+    """
+    a, b = 0, 1
+    for bit in bin(k)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == '1':
+            a, b = b, a + b
+    return a, b
+
+
+# log(phi) and log(sqrt(5)) for estimating Fibonacci indices: F(k) ~ phi^k / sqrt(5)
+_LOG_PHI = math.log((1 + math.sqrt(5)) / 2)
+_LOG_SQRT5 = math.log(5) / 2
+
+
+def largest_fib(n):
+    """
+    Return the largest Fibonacci number <= n
+    
+    A binary search over the precomputed table, so no sequence is
+    generated for any 64-bit input. Larger inputs estimate the index from
+    logarithms and compute F(k) directly with fast doubling.
+    
+    Args:
+        n (int): Upper limit
+        
+    Returns:
+        int: Largest Fibonacci number <= n (1 when n < 1)
+        
+    Example:
+        >>> largest_fib(100)
+        89
+    """
+    if n < _FIBS[-1]:
+        return _FIBS[max(bisect_right(_FIBS, n) - 1, 0)]
+    
+    # The float estimate can be off by one either way; fix it up exactly
+    k = int((math.log(n) + _LOG_SQRT5) / _LOG_PHI)
+    fib, next_fib = _fib_pair(k)
+    while fib > n:
+        fib, next_fib = next_fib - fib, fib
+    while next_fib <= n:
+        fib, next_fib = next_fib, fib + next_fib
+    return fib
+
+
+def fib_encode_int(n):
+    """
+    Encode a positive integer as a Zeckendorf bitmask
+    
+    Bit i of the returned integer is set when the i-th Fibonacci number
+    (1, 2, 3, 5, 8, ...) is part of the representation. The highest set
+    bit is always the largest Fibonacci number <= n, so the codeword
+    length is ``mask.bit_length() + 1`` (the extra bit is the terminator).
+    
+    This is the hot-path primitive used by the string-based API; it keeps
+    the whole greedy loop in native integer operations.
+    
+    Args:
+        n (int): Positive integer to encode
+        
+    Returns:
+        int: Zeckendorf bitmask of n
+        
+    Raises:
+        ValueError: If n is not a positive integer
+        
+    Examples:
+        >>> fib_encode_int(1)
+        1
+        >>> fib_encode_int(4)
+        5
+    """
+    if n <= 0:
+        raise ValueError("Only positive integers can be encoded. Got: {}".format(n))
+    
+    if _fib_encode_nb is not None and n < _NB_LIMIT:
+        return int(_fib_encode_nb(n, _FIBS_NB)[0])
+    
+    # Index of the largest Fibonacci number <= n
+    if n < _FIBS[-1]:
+        fibs = _FIBS
+        i = bisect_right(_FIBS, n) - 1
+    else:
+        fibs = generate_fibs(n)
+        i = len(fibs) - 1
+    
+    # Greedy algorithm: Start from largest Fibonacci number
+    # and work backwards (Zeckendorf representation)
+    mask = 0
+    remainder = n
+    
+    while remainder > 0 and i >= 0:
+        if remainder >= fibs[i]:
+            mask |= 1 << i
+            remainder -= fibs[i]
+        i -= 1
+    
+    return mask
 
 
 def fib_encode(n):
@@ -70,33 +273,52 @@ def fib_encode(n):
         >>> fib_encode(5)
         '00011'
     """
-    if n <= 0:
-        raise ValueError("Only positive integers can be encoded. Got: {}".format(n))
-    
-    # Generate Fibonacci numbers up to n
-    fibs = generate_fibs(n)
-    
-    if not fibs:
-        # Edge case: n = 1
-        return '11'
+    return _cached_code(n)
+
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
+def _cached_code(n):
+    """
+    Codeword for n, memoized
     
-    # Initialize code array with zeros
-    code = ['0'] * len(fibs)
+    Real datasets repeat small values heavily, so most calls become a
+    dict lookup instead of a greedy Zeckendorf loop. Errors are raised,
+    not cached.
+    """
+    return _mask_to_code(fib_encode_int(n))
+
+
+def _mask_to_code(mask):
+    """
+    Render a Zeckendorf bitmask as a Fibonacci codeword string
     
-    # Greedy algorithm: Start from largest Fibonacci number
-    # and work backwards (Zeckendorf representation)
-    i = len(fibs) - 1
-    remainder = n
+    Sets the terminator bit just above the largest Fibonacci number used
+    and stringifies once; reversing puts F(1) first as in the classic
+    layout. The terminator creates a unique '11' pattern that marks the end.
+    """
+    return format(mask | (1 << mask.bit_length()), 'b')[::-1]
+
+
+def fib_encode_mask(n):
+    """
+    Encode a positive integer as a Zeckendorf bitmask plus codeword length
     
-    while remainder > 0 and i >= 0:
-        if remainder >= fibs[i]:
-            code[i] = '1'
-            remainder -= fibs[i]
-        i -= 1
+    Lets statistics code reason about a codeword without building its
+    string: the length is the mask's bit length plus the terminator, and
+    ``mask.bit_count()`` is the number of Fibonacci terms used.
     
-    # Join code and append '1' terminator
-    # The terminator creates a unique '11' pattern that marks the end
-    return ''.join(code) + '1'
+    Args:
+        n (int): Positive integer to encode
+        
+    Returns:
+        tuple: (mask, bit_length) where bit_length includes the terminator
+        
+    Example:
+        >>> fib_encode_mask(4)
+        (5, 4)
+    """
+    mask = fib_encode_int(n)
+    return mask, mask.bit_length() + 1
 
 
 def fib_decode(code):
@@ -136,28 +358,129 @@ def fib_decode(code):
     # Remove terminating '1'
     code = code[:-1]
     
-    if not code:
-        # Special case: '11' decodes to 1
-        return 1
+    # Parse the code into a bitmask (bit i = i-th character)
+    mask = int(code[::-1], 2)
     
-    # Generate Fibonacci numbers
-    # We need as many as there are bits in the code
-    length = len(code)
-    fibs = []
-    a, b = 1, 2
-    for _ in range(length):
-        fibs.append(a)
-        a, b = b, a + b
+    if _fib_decode_nb is not None and len(code) <= _NB_MAX_BITS:
+        return int(_fib_decode_nb(mask, len(code), _FIBS_NB))
+    
+    # We need as many Fibonacci numbers as there are bits in the code
+    fibs = _fib_table(len(code))
     
-    # Calculate sum based on code bits
+    # Sum Fibonacci numbers for each set bit
     result = 0
-    for i, bit in enumerate(code):
-        if bit == '1':
-            result += fibs[i]
+    while mask:
+        low = mask & -mask
+        result += fibs[low.bit_length() - 1]
+        mask ^= low
     
     return result
 
 
+def _zeckendorf_bits(arr):
+    """
+    Fibonacci-encode a positive int64 array in one batch
+    
+    Runs the greedy Zeckendorf loop column-wise: one vectorized compare
+    and subtract per Fibonacci number (~90 passes at most) regardless of
+    dataset size. The per-number bit rows are then trimmed to their
+    codeword length and flattened in stream order.
+    
+    Args:
+        arr (numpy.ndarray): 1-D int64 array of positive integers
+        
+    Returns:
+        numpy.ndarray: Flat uint8 array of 0/1 bits of all encoded numbers
+    """
+    fibs = np.array(_FIBS[:bisect_right(_FIBS, int(arr.max()))], dtype=np.int64)
+    width = len(fibs) + 1
+    
+    # bits[k, i] == 1 when F(i) is part of the representation of arr[k]
+    bits = np.zeros((arr.size, width), dtype=np.uint8)
+    remainder = arr.copy()
+    for i in range(len(fibs) - 1, -1, -1):
+        take = remainder >= fibs[i]
+        bits[:, i] = take
+        remainder -= fibs[i] * take
+    
+    # Terminator goes right after the largest Fibonacci number used
+    highest = np.searchsorted(fibs, arr, side='right') - 1
+    bits[np.arange(arr.size), highest + 1] = 1
+    
+    # Keep only the first (highest + 2) bits of every row
+    valid = np.arange(width) < (highest + 2)[:, None]
+    return bits[valid]
+
+
+def _as_vectorizable(numbers):
+    """
+    Return numbers as an int64 array if the vectorized encoder can take it
+    
+    Only large, one-dimensional datasets of positive integers below 2^63
+    qualify; anything else returns None and is encoded number by number.
+    """
+    if len(numbers) < _VECTORIZE_MIN_SIZE:
+        return None
+    
+    arr = np.asarray(numbers)
+    if arr.ndim == 1 and arr.dtype.kind in 'iu' and arr.min() > 0 and arr.max() < 2 ** 63:
+        return arr.astype(np.int64)
+    return None
+
+
+def _validate_dataset(numbers):
+    """
+    Check that every number is a positive integer, in one pass up front
+    
+    Integer NumPy arrays are checked with a single vectorized comparison.
+    For lists, the common all-int case is confirmed with C-level set/min
+    passes; only if that fails are elements inspected one by one to find
+    (and report) the offending value.
+    
+    Args:
+        numbers (list or numpy.ndarray): Non-empty dataset
+        
+    Returns:
+        list or numpy.ndarray: The validated dataset, ready for encoding
+        
+    Raises:
+        ValueError: If any number is not a positive integer
+    """
+    if isinstance(numbers, np.ndarray):
+        if numbers.ndim == 1 and numbers.dtype.kind in 'iu' and (numbers > 0).all():
+            return numbers
+        numbers = numbers.tolist()
+    
+    if set(map(type, numbers)) <= {int} and min(numbers) > 0:
+        return numbers
+    
+    for num in numbers:
+        if not isinstance(num, int) or num <= 0:
+            raise ValueError(f"Invalid number in dataset: {num}. Only positive integers supported.")
+    
+    return numbers
+
+
+def _compress_validated(numbers):
+    """
+    Fibonacci-encode a dataset already checked by _validate_dataset
+    
+    Args:
+        numbers (list or numpy.ndarray): Positive integers
+        
+    Returns:
+        str: Concatenated binary string of all encoded numbers
+    """
+    arr = _as_vectorizable(numbers)
+    if arr is not None:
+        return (_zeckendorf_bits(arr) + ord('0')).tobytes().decode('ascii')
+    
+    if isinstance(numbers, np.ndarray):
+        numbers = numbers.tolist()
+    
+    return ''.join(map(fib_encode, numbers))
+
+
 def compress_dataset(numbers):
     """
     Compress a list of positive integers using Fibonacci coding
@@ -166,8 +489,11 @@ def compress_dataset(numbers):
     and the results are concatenated. The '11' terminator of each
     codeword allows unambiguous parsing during decompression.
     
+    Large datasets that fit in int64 are encoded with a vectorized
+    NumPy pass; everything else goes through fib_encode per number.
+    
     Args:
-        numbers (list): List of positive integers
+        numbers (list or numpy.ndarray): List of positive integers
         
     Returns:
         str: Concatenated binary string of all encoded numbers
@@ -179,19 +505,51 @@ def compress_dataset(numbers):
         >>> compress_dataset([1, 2, 3])
         '110110011'
     """
-    if not numbers:
+    if len(numbers) == 0:
         return ''
     
-    compressed = []
+    return _compress_validated(_validate_dataset(numbers))
+
+
+def fib_encode_batch(numbers):
+    """
+    Fibonacci-encode many integers, returning one codeword per number
     
-    for num in numbers:
-        if not isinstance(num, int) or num <= 0:
-            raise ValueError(f"Invalid number in dataset: {num}. Only positive integers supported.")
+    Large int64-range datasets are encoded in a single vectorized pass
+    (see _zeckendorf_bits) and the stream is cut at the codeword lengths;
+    anything else maps fib_encode over the values.
+    
+    Args:
+        numbers (list or numpy.ndarray): Positive integers
+        
+    Returns:
+        list: Codeword strings, in input order
+        
+    Raises:
+        ValueError: If any number is not a positive integer
         
-        encoded = fib_encode(num)
-        compressed.append(encoded)
+    Example:
+        >>> fib_encode_batch([1, 4, 100])
+        ['11', '1011', '00101000011']
+    """
+    if len(numbers) == 0:
+        return []
+    
+    numbers = _validate_dataset(numbers)
+    
+    arr = _as_vectorizable(numbers)
+    if arr is None:
+        if isinstance(numbers, np.ndarray):
+            numbers = numbers.tolist()
+        return list(map(fib_encode, numbers))
     
-    return ''.join(compressed)
+    text = (_zeckendorf_bits(arr) + ord('0')).tobytes().decode('ascii')
+    
+    # Codeword length = (number of Fibonacci numbers <= n) + terminator,
+    # counted over the same table _zeckendorf_bits used for the bits
+    fibs = np.array(_FIBS[:bisect_right(_FIBS, int(arr.max()))], dtype=np.int64)
+    ends = np.cumsum(np.searchsorted(fibs, arr, side='right') + 1).tolist()
+    return [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
 
 
 def decompress_dataset(compressed_string, count):
@@ -222,24 +580,294 @@ def decompress_dataset(compressed_string, count):
     numbers = []
     i = 0
     
-    while i < len(compressed_string):
-        # Find next '11' terminator
-        j = i + 1
-        
-        while j < len(compressed_string):
-            if compressed_string[j-1:j+1] == '11':
-                # Found a complete codeword
-                codeword = compressed_string[i:j+1]
-                number = fib_decode(codeword)
-                numbers.append(number)
-                i = j + 1
-                break
-            j += 1
-        else:
+    length = len(compressed_string)
+    
+    while i < length:
+        # Find next '11' terminator (C-level scan)
+        j = compressed_string.find('11', i)
+        
+        if j == -1:
             # Reached end without finding terminator
-            if i < len(compressed_string):
-                raise ValueError(f"Invalid compressed data: no terminator found starting at position {i}")
-            break
+            raise ValueError(f"Invalid compressed data: no terminator found starting at position {i}")
+        
+        # Found a complete codeword: parse its mask bits (everything before
+        # the terminator) straight to an int and sum via the byte table
+        numbers.append(_fib_sum(int(compressed_string[i:j+1][::-1], 2)))
+        i = j + 2
+    
+    # Validate count
+    if len(numbers) != count:
+        raise ValueError(f"Expected {count} numbers, but decoded {len(numbers)}")
+    
+    return numbers
+
+
+# ================================================
+# PACKED (BYTES) ENCODING
+# ================================================
+
+def _pack_bits(bit_string):
+    """
+    Pack a '0'/'1' string into bytes, MSB first, zero-padded at the end
+    
+    Args:
+        bit_string (str): Binary string
+        
+    Returns:
+        bytes: Packed bits (``(len(bit_string) + 7) // 8`` bytes)
+    """
+    if not bit_string:
+        return b''
+    pad = -len(bit_string) % 8
+    return (int(bit_string, 2) << pad).to_bytes((len(bit_string) + pad) // 8, 'big')
+
+
+def fib_encode_bytes(n):
+    """
+    Encode a positive integer using Fibonacci coding into packed bytes
+    
+    Args:
+        n (int): Positive integer to encode
+        
+    Returns:
+        tuple: (bytes, bit_length) - packed codeword and its length in bits
+        
+    Example:
+        >>> fib_encode_bytes(4)
+        (b'\\xb0', 4)
+    """
+    code = fib_encode(n)
+    return _pack_bits(code), len(code)
+
+
+def compress_dataset_bytes(numbers):
+    """
+    Compress a list of positive integers into packed Fibonacci-coded bytes
+    
+    Produces the same bit stream as compress_dataset, stored 8 bits per
+    byte instead of one character per bit.
+    
+    Args:
+        numbers (list or numpy.ndarray): List of positive integers
+        
+    Returns:
+        tuple: (bytes, bit_length) - packed stream and its length in bits
+        
+    Raises:
+        ValueError: If any number is not a positive integer
+        
+    Example:
+        >>> compress_dataset_bytes([1, 2, 3])
+        (b'\\xd9\\x80', 9)
+    """
+    if len(numbers) == 0:
+        return b'', 0
+    
+    numbers = _validate_dataset(numbers)
+    
+    arr = _as_vectorizable(numbers)
+    if arr is not None:
+        bits = _zeckendorf_bits(arr)
+        return np.packbits(bits).tobytes(), int(bits.size)
+    
+    compressed = _compress_validated(numbers)
+    return _pack_bits(compressed), len(compressed)
+
+
+def _build_fib_dfa():
+    """
+    Build the byte-at-a-time Fibonacci decoding automaton
+    
+    The only state carried between bytes is whether the previous bit was
+    a '1'. For each (state, byte) the entry lists the codeword pieces the
+    byte contributes, as (bits, bit_count, terminates) tuples in stream
+    order (bits are LSB-first, i.e. bit k is the k-th bit of the piece),
+    plus the state after the byte.
+    
+    Returns:
+        list: table[prev_bit][byte] -> (pieces, next_prev_bit)
+    """
+    table = [[None] * 256 for _ in range(2)]
+    
+    for prev_bit in (0, 1):
+        for byte in range(256):
+            pieces = []
+            bits = 0
+            bit_count = 0
+            prev = prev_bit
+            
+            for k in range(7, -1, -1):
+                bit = (byte >> k) & 1
+                if bit and prev:
+                    # Second '1' in a row: terminator, not part of the mask
+                    pieces.append((bits, bit_count, True))
+                    bits = 0
+                    bit_count = 0
+                    prev = 0
+                else:
+                    bits |= bit << bit_count
+                    bit_count += 1
+                    prev = bit
+            
+            if bit_count:
+                pieces.append((bits, bit_count, False))
+            table[prev_bit][byte] = (tuple(pieces), prev)
+    
+    return table
+
+
+_FIB_DFA = _build_fib_dfa()
+
+
+def _build_fib_byte_sums():
+    """
+    Precompute partial Fibonacci sums for every byte of a Zeckendorf mask
+    
+    Row k maps an 8-bit chunk (mask bits 8k..8k+7) to the sum of the
+    Fibonacci numbers those bits select, so a mask can be summed one byte
+    at a time instead of one set bit at a time.
+    
+    Returns:
+        list: sums[k][byte] -> partial sum for byte k of the mask
+    """
+    return [
+        [sum(_FIBS[base + b] for b in range(8) if byte >> b & 1) for byte in range(256)]
+        for base in range(0, len(_FIBS) - 7, 8)
+    ]
+
+
+_FIB_BYTE_SUMS = _build_fib_byte_sums()
+_FIB_BYTE_SUMS_BITS = len(_FIB_BYTE_SUMS) * 8
+
+
+def _fib_sum(mask):
+    """Sum the Fibonacci numbers selected by the set bits of a Zeckendorf mask"""
+    bit_length = mask.bit_length()
+    if bit_length <= _FIB_BYTE_SUMS_BITS:
+        # One table lookup per mask byte (C-level map over the rows)
+        return sum(map(list.__getitem__, _FIB_BYTE_SUMS, mask.to_bytes((bit_length + 7) >> 3, 'little')))
+    
+    fibs = _fib_table(bit_length)
+    result = 0
+    while mask:
+        low = mask & -mask
+        result += fibs[low.bit_length() - 1]
+        mask ^= low
+    return result
+
+
+# Widest mask whose value is guaranteed to fit int64 (sum < F(width))
+_DECODE_MAX_BITS = bisect_right(_FIBS, 2 ** 63 - 1) - 1
+# Fibonacci weights per codeword bit; the trailing 0 is the terminator's weight
+_DECODE_WEIGHTS = np.array(_FIBS[:_DECODE_MAX_BITS] + [0], dtype=np.int64)
+
+
+def _unzeckendorf_bytes(data, bit_length, count):
+    """
+    Decode a packed Fibonacci stream in one batch with NumPy
+    
+    Works on the positions of the set bits only. Inside every run of
+    consecutive ones the terminators sit at the odd offsets (the same
+    rule the sequential decoder applies bit by bit), so the codeword
+    boundaries fall out of a few array passes; each value is then the
+    sum of the Fibonacci weights of its mask bits (one reduceat).
+    
+    Args:
+        data (bytes): Packed stream from compress_dataset_bytes
+        bit_length (int): Number of meaningful bits in data
+        count (int): Expected number of integers
+        
+    Returns:
+        list or None: Decoded integers, or None if the stream is not a
+        well-formed int64-range stream of exactly count codewords (the
+        caller then falls back to the byte automaton, which reports the
+        precise error or handles arbitrarily large values)
+    """
+    padding = len(data) * 8 - bit_length
+    if padding and data[-1] & ((1 << padding) - 1):
+        return None
+    
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=bit_length)
+    ones = np.flatnonzero(bits)
+    
+    # Offset of every '1' inside its run of consecutive ones
+    run_start = np.ones(ones.size, dtype=bool)
+    run_start[1:] = ones[1:] - ones[:-1] != 1
+    index = np.arange(ones.size)
+    offset = index - np.maximum.accumulate(np.where(run_start, index, 0))
+    
+    is_term = (offset & 1).astype(bool)
+    term_index = np.flatnonzero(is_term)
+    if term_index.size != count or ones[term_index[-1]] != bit_length - 1:
+        return None
+    
+    terms = ones[term_index]
+    starts = np.empty(count, dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = terms[:-1] + 1
+    if (terms - starts).max() > _DECODE_MAX_BITS:
+        return None
+    
+    # Bit position of every '1' within its codeword; terminators get weight 0
+    code = np.cumsum(is_term) - is_term
+    position = ones - starts[code]
+    position[term_index] = _DECODE_MAX_BITS
+    
+    first = np.empty(count, dtype=np.int64)
+    first[0] = 0
+    first[1:] = term_index[:-1] + 1
+    return np.add.reduceat(_DECODE_WEIGHTS[position], first).tolist()
+
+
+def decompress_dataset_bytes(data, bit_length, count):
+    """
+    Decompress packed Fibonacci-coded bytes back to a list of integers
+    
+    Large streams are decoded in one batch by _unzeckendorf_bytes. Others
+    (and anything that batch decoder rejects) drive the precomputed
+    automaton from _build_fib_dfa: each input byte is a single table
+    lookup that yields the codeword pieces it contains, so the Python loop
+    runs once per byte instead of once per bit.
+    
+    Args:
+        data (bytes): Packed stream from compress_dataset_bytes
+        bit_length (int): Number of meaningful bits in data
+        count (int): Expected number of integers (for validation)
+        
+    Returns:
+        list: List of decoded integers
+        
+    Raises:
+        ValueError: If decompression fails or count mismatch
+    """
+    padding = len(data) * 8 - bit_length
+    if padding < 0:
+        raise ValueError(f"Bit length {bit_length} exceeds data size ({len(data)} bytes)")
+    
+    if count >= _VECTORIZE_MIN_SIZE:
+        numbers = _unzeckendorf_bytes(data, bit_length, count)
+        if numbers is not None:
+            return numbers
+    
+    table = _FIB_DFA
+    numbers = []
+    prev = 0
+    mask = 0
+    pos = 0
+    
+    for byte in data:
+        pieces, prev = table[prev][byte]
+        for bits, bit_count, terminates in pieces:
+            mask |= bits << pos
+            pos += bit_count
+            if terminates:
+                numbers.append(_fib_sum(mask))
+                mask = 0
+                pos = 0
+    
+    # Whatever follows the last terminator must be the zero padding
+    if pos > padding:
+        raise ValueError(f"Invalid compressed data: no terminator found starting at position {bit_length - (pos - padding)}")
     
     # Validate count
     if len(numbers) != count:
@@ -260,22 +888,32 @@ def get_compression_info(numbers):
     Returns:
         dict: Dictionary with compression details
     """
-    compressed = compress_dataset(numbers)
-    
-    # Calculate individual encodings
+    # Encode each number once; the compressed string is the
+    # concatenation of the individual codes
     encodings = []
+    parts = []
+    compressed_bits = 0
     for num in numbers:
-        code = fib_encode(num)
+        if not isinstance(num, int) or num <= 0:
+            raise ValueError(f"Invalid number in dataset: {num}. Only positive integers supported.")
+        
+        # Lengths and term counts come straight from the integer mask
+        mask, length = fib_encode_mask(num)
+        code = _mask_to_code(mask)
+        parts.append(code)
+        compressed_bits += length
         encodings.append({
             'number': num,
             'code': code,
-            'length': len(code)
+            'length': length,
+            'terms': mask.bit_count()
         })
     
+    compressed = ''.join(parts)
+    
     # Calculate statistics
     # Use 32-bit integers as baseline (realistic storage size)
     original_bits = len(numbers) * 32
-    compressed_bits = len(compressed)
     
     return {
         'original_numbers': numbers,
@@ -315,14 +953,22 @@ def test_fibonacci_coding():
     ]
     
     print("\n1. Testing individual encodings:")
-    for num, expected_code in test_cases:
-        code = fib_encode(num)
+    codes = fib_encode_batch([num for num, _ in test_cases])
+    for (num, expected_code), code in zip(test_cases, codes):
         success = "✓" if code == expected_code else "✗"
         print(f"   {success} fib_encode({num}) = {code} {'(expected: ' + expected_code + ')' if code != expected_code else ''}")
     
+    # Batch encoding near the top of int64 must agree with fib_encode
+    boundary = [1] * (_VECTORIZE_MIN_SIZE - 1) + [_FIBS[90] - 1, _FIBS[90], 2 ** 63 - 1, 5]
+    batch_codes = fib_encode_batch(boundary)
+    mismatches = sum(code != fib_encode(num) for num, code in zip(boundary, batch_codes))
+    print(f"   {'✓' if mismatches == 0 else '✗'} fib_encode_batch at the int64 boundary matches fib_encode ({mismatches} mismatches)")
+    
     print("\n2. Testing decoding:")
-    for num, code in test_cases:
-        decoded = fib_decode(code)
+    # Decode all codewords as one packed stream through the byte automaton
+    stream = ''.join(code for _, code in test_cases)
+    decoded_values = decompress_dataset_bytes(_pack_bits(stream), len(stream), len(test_cases))
+    for (num, code), decoded in zip(test_cases, decoded_values):
         success = "✓" if decoded == num else "✗"
         print(f"   {success} fib_decode({code}) = {decoded} {'(expected: ' + str(num) + ')' if decoded != num else ''}")
     
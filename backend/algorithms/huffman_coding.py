@@ -8,6 +8,16 @@ References:
 
 import heapq
 from collections import Counter, defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+# Integer arrays whose values are all below this are counted with bincount
+_BINCOUNT_MAX_VALUE = 1 << 20
+
+# Only distributions with at most this many symbols are memoized; larger
+# codebooks are rebuilt per call so the caches stay small
+_MEMO_MAX_SYMBOLS = 4096
 
 
 class HuffmanNode:
@@ -61,28 +71,84 @@ def build_huffman_tree(frequencies):
     if not frequencies:
         return None
     
-    # Create a min-heap of leaf nodes
-    heap = [HuffmanNode(freq, value) for value, freq in frequencies.items()]
+    # Create a min-heap of leaf nodes. Entries are (freq, order, node)
+    # tuples: the unique insertion counter breaks ties, so heap
+    # comparisons stay native int compares and never reach HuffmanNode
+    heap = [(freq, order, HuffmanNode(freq, value))
+            for order, (value, freq) in enumerate(frequencies.items())]
     heapq.heapify(heap)
+    order = len(heap)
     
     # Build tree by combining nodes
     while len(heap) > 1:
         # Extract two nodes with minimum frequency
-        left = heapq.heappop(heap)
-        right = heapq.heappop(heap)
+        left_freq, _, left = heapq.heappop(heap)
+        right_freq, _, right = heapq.heappop(heap)
         
         # Create parent node with combined frequency
         parent = HuffmanNode(
-            freq=left.freq + right.freq,
+            freq=left_freq + right_freq,
             left=left,
             right=right
         )
         
         # Add parent back to heap
-        heapq.heappush(heap, parent)
+        heapq.heappush(heap, (parent.freq, order, parent))
+        order += 1
     
     # Root is the last remaining node
-    return heap[0]
+    return heap[0][2]
+
+
+def huffman_code_lengths(frequencies):
+    """
+    Compute optimal Huffman code lengths without building node objects
+    
+    Uses the two-queue construction (van Leeuwen, 1976): after a single
+    sort by frequency, leaves are consumed in order and merged nodes are
+    produced in non-decreasing frequency order, so the two minima are
+    always at the front of one of the two queues. Merging is O(n) and
+    nodes are plain indices into flat frequency/parent lists.
+    
+    Args:
+        frequencies (dict): Dictionary mapping values to frequencies
+        
+    Returns:
+        dict: Mapping from values to code lengths (1 bit for a single value)
+    """
+    if not frequencies:
+        return {}
+    
+    items = sorted(frequencies.items(), key=lambda item: item[1])
+    n = len(items)
+    
+    if n == 1:
+        return {items[0][0]: 1}
+    
+    # Nodes 0..n-1 are leaves (sorted queue), n..2n-2 internal (FIFO queue)
+    freq = [f for _, f in items] + [0] * (n - 1)
+    parent = [0] * (2 * n - 1)
+    leaf = 0
+    internal = n
+    
+    for node in range(n, 2 * n - 1):
+        # Take the two smallest fronts of the leaf and internal queues
+        for _ in range(2):
+            if leaf < n and (internal >= node or freq[leaf] <= freq[internal]):
+                child = leaf
+                leaf += 1
+            else:
+                child = internal
+                internal += 1
+            freq[node] += freq[child]
+            parent[child] = node
+    
+    # Parents always have a higher index, so one downward pass gives depths
+    depth = [0] * (2 * n - 1)
+    for node in range(2 * n - 3, -1, -1):
+        depth[node] = depth[parent[node]] + 1
+    
+    return {value: depth[i] for i, (value, _) in enumerate(items)}
 
 
 def build_codebook(root):
@@ -104,22 +170,188 @@ def build_codebook(root):
     
     codebook = {}
     
-    def traverse(node, code=''):
-        """Recursive tree traversal to build codes"""
+    # Iterative traversal; codes are kept as (int, length) until a leaf
+    # is reached so no intermediate strings are created
+    stack = [(root, 0, 0)]
+    while stack:
+        node, code, length = stack.pop()
+        
         if node.is_leaf():
             # Leaf node - assign code
-            codebook[node.value] = code if code else '0'  # Handle single-value case
+            codebook[node.value] = format(code, f'0{length}b') if length else '0'  # Handle single-value case
         else:
-            # Internal node - recurse
-            if node.left:
-                traverse(node.left, code + '0')
+            # Internal node - push right first so the left branch is visited first
             if node.right:
-                traverse(node.right, code + '1')
+                stack.append((node.right, (code << 1) | 1, length + 1))
+            if node.left:
+                stack.append((node.left, code << 1, length + 1))
+    
+    return codebook
+
+
+def get_code_lengths(codebook):
+    """
+    Extract code lengths from a codebook
+    
+    Code lengths are all a canonical decoder needs, so this is the
+    side data that would be transmitted alongside the compressed bits.
+    
+    Args:
+        codebook (dict): Mapping from values to binary code strings
+        
+    Returns:
+        dict: Mapping from values to code lengths
+    """
+    return {value: len(code) for value, code in codebook.items()}
+
+
+def _canonical_order(code_lengths):
+    """Symbols sorted by (code length, value) - the canonical code order"""
+    return sorted(code_lengths, key=lambda value: (code_lengths[value], value))
+
+
+def canonical_codebook(code_lengths):
+    """
+    Build canonical Huffman codes from code lengths
+    
+    Symbols are sorted by (length, value) and assigned consecutive codes;
+    the code is left-shifted whenever the length increases. The result is
+    prefix-free with the same lengths as the tree codes, so compressed
+    size is unchanged, but the decoder only needs the lengths.
+    
+    Args:
+        code_lengths (dict): Mapping from values to code lengths
+        
+    Returns:
+        dict: Mapping from values to canonical binary code strings
+        
+    Example:
+        >>> canonical_codebook({1: 3, 2: 3, 3: 2, 4: 1})
+        {4: '0', 3: '10', 1: '110', 2: '111'}
+    """
+    codebook = {}
+    code = 0
+    prev_length = 0
+    
+    for value in _canonical_order(code_lengths):
+        length = code_lengths[value]
+        code <<= length - prev_length
+        codebook[value] = format(code, f'0{length}b')
+        code += 1
+        prev_length = length
     
-    traverse(root)
     return codebook
 
 
+def _canonical_decode_tables(code_lengths):
+    """
+    Build canonical decode tables
+    
+    Returns:
+        tuple: (symbols in canonical order,
+                list of (length, first_code, code_count, first_index)
+                per distinct length, ascending)
+    """
+    symbols = _canonical_order(code_lengths)
+    tables = []
+    code = 0
+    prev_length = 0
+    
+    for index, value in enumerate(symbols):
+        length = code_lengths[value]
+        code <<= length - prev_length
+        if length != prev_length:
+            tables.append([length, code, 0, index])
+        tables[-1][2] += 1
+        code += 1
+        prev_length = length
+    
+    return symbols, [tuple(entry) for entry in tables]
+
+
+@lru_cache(maxsize=128)
+def _codebook_for(frequency_items):
+    """
+    Build (and memoize) the canonical codebook for a distribution
+    
+    Args:
+        frequency_items (frozenset): (value, frequency) pairs
+        
+    Returns:
+        dict: Canonical codebook. Shared between calls - do not mutate.
+    """
+    return canonical_codebook(huffman_code_lengths(dict(frequency_items)))
+
+
+def get_codebook(frequencies):
+    """
+    Get the Huffman codebook for a frequency table
+    
+    Codes are canonical (see canonical_codebook), with lengths from the
+    linear-time two-queue construction. Identical distributions of up to
+    _MEMO_MAX_SYMBOLS values reuse the previously built codebook.
+    
+    Args:
+        frequencies (dict): Dictionary mapping values to frequencies
+        
+    Returns:
+        dict: Mapping from values to binary code strings (shared - do not mutate)
+    """
+    if len(frequencies) > _MEMO_MAX_SYMBOLS:
+        return canonical_codebook(huffman_code_lengths(frequencies))
+    return _codebook_for(frozenset(frequencies.items()))
+
+
+def _count_frequencies(numbers):
+    """
+    Count how often each value occurs in a dataset
+    
+    Integer NumPy arrays are histogrammed in C: np.bincount when the
+    values are small non-negative integers, np.unique otherwise. Other
+    inputs use Counter.
+    
+    Args:
+        numbers (list or numpy.ndarray): Integers to count
+        
+    Returns:
+        dict: Mapping from values (Python ints) to frequencies
+        
+    Example:
+        >>> _count_frequencies(np.array([3, 1, 3]))
+        {1: 1, 3: 2}
+    """
+    if not (isinstance(numbers, np.ndarray) and numbers.ndim == 1
+            and numbers.dtype.kind in 'iu' and numbers.size):
+        return Counter(numbers)
+    
+    if numbers.min() >= 0 and numbers.max() < _BINCOUNT_MAX_VALUE:
+        counts = np.bincount(numbers)
+        values = np.flatnonzero(counts)
+        counts = counts[values]
+    else:
+        values, counts = np.unique(numbers, return_counts=True)
+    
+    return dict(zip(values.tolist(), counts.tolist()))
+
+
+def _encode_with_codebook(numbers, codebook):
+    """
+    Encode numbers with a prebuilt codebook
+    
+    Args:
+        numbers (list): List of integers to encode
+        codebook (dict): Mapping from values to binary code strings
+        
+    Returns:
+        str: Binary string of compressed data
+    """
+    # map() over the bound lookup keeps the per-symbol loop in C
+    # (no generator frame per element); arrays are looked up as Python ints
+    if isinstance(numbers, np.ndarray):
+        numbers = numbers.tolist()
+    return ''.join(map(codebook.__getitem__, numbers))
+
+
 def huffman_compress(numbers):
     """
     Compress a list of integers using Huffman coding
@@ -132,7 +364,7 @@ def huffman_compress(numbers):
     5. Concatenate all codes
     
     Args:
-        numbers (list): List of integers to compress
+        numbers (list or numpy.ndarray): Integers to compress
         
     Returns:
         str: Binary string of compressed data
@@ -142,28 +374,22 @@ def huffman_compress(numbers):
         with the compressed data for decompression. This simplified version
         assumes the decoder has access to the codebook.
     """
-    if not numbers:
+    if len(numbers) == 0:
         return ''
     
     # Count frequencies
-    frequencies = Counter(numbers)
+    frequencies = _count_frequencies(numbers)
     
     # Handle single unique value case
     if len(frequencies) == 1:
-        value = list(frequencies.keys())[0]
         # Use single bit per occurrence
         return '0' * len(numbers)
     
-    # Build Huffman tree
-    root = build_huffman_tree(frequencies)
-    
-    # Generate codebook
-    codebook = build_codebook(root)
+    # Build Huffman tree and generate codebook
+    codebook = get_codebook(frequencies)
     
     # Encode data
-    compressed = ''.join(codebook[num] for num in numbers)
-    
-    return compressed
+    return _encode_with_codebook(numbers, codebook)
 
 
 def huffman_decompress(compressed_string, codebook_inverted, count):
@@ -197,17 +423,187 @@ def huffman_decompress(compressed_string, codebook_inverted, count):
     return numbers
 
 
+def huffman_decompress_canonical(compressed_string, code_lengths, count):
+    """
+    Decompress canonical Huffman-encoded data using only code lengths
+    
+    Instead of growing a prefix bit by bit and probing a dict, the decoder
+    reads a max-length window, and the first length L whose prefix falls
+    below that length's last code identifies the codeword. The symbol is
+    then found by offset in the canonical order.
+    
+    Args:
+        compressed_string (str): Binary string of compressed data
+        code_lengths (dict): Mapping from values to code lengths
+        count (int): Number of values to decode
+        
+    Returns:
+        list: Decompressed list of integers
+        
+    Raises:
+        ValueError: If the data contains an invalid or truncated codeword
+    """
+    if not compressed_string or not code_lengths:
+        return []
+    
+    symbols, tables = _canonical_decode_tables(code_lengths)
+    max_length = tables[-1][0]
+    total_bits = len(compressed_string)
+    
+    # Zero-pad so the window read near the end is always full width
+    padded = compressed_string + '0' * max_length
+    
+    numbers = []
+    pos = 0
+    
+    while pos < total_bits and len(numbers) < count:
+        window = int(padded[pos:pos + max_length], 2)
+        
+        for length, first_code, code_count, first_index in tables:
+            prefix = window >> (max_length - length)
+            if prefix < first_code + code_count:
+                break
+        else:
+            raise ValueError(f"Invalid Huffman code at bit {pos}")
+        
+        if pos + length > total_bits:
+            raise ValueError(f"Truncated Huffman code at bit {pos}")
+        
+        numbers.append(symbols[first_index + prefix - first_code])
+        pos += length
+    
+    return numbers
+
+
+def huffman_compress_bytes(numbers):
+    """
+    Compress a list of integers using Huffman coding into packed bytes
+    
+    Produces the same bit stream as huffman_compress, stored 8 bits per
+    byte (MSB first, zero-padded at the end).
+    
+    Args:
+        numbers (list or numpy.ndarray): Integers to compress
+        
+    Returns:
+        tuple: (bytes, bit_length) - packed stream and its length in bits
+    """
+    compressed = huffman_compress(numbers)
+    if not compressed:
+        return b'', 0
+    
+    pad = -len(compressed) % 8
+    packed = (int(compressed, 2) << pad).to_bytes((len(compressed) + pad) // 8, 'big')
+    return packed, len(compressed)
+
+
+class _HuffmanDFA:
+    """
+    Byte-at-a-time Huffman decoding automaton
+    
+    States are the internal nodes of the code trie (state 0 is the root,
+    i.e. no pending prefix). row(state)[byte] gives (next_state, symbols)
+    for feeding the 8 bits of byte from that state; next_state is -1 when
+    the byte walks off the trie. Rows are built lazily on first use, so
+    only states actually reached by the data cost anything.
+    """
+    
+    def __init__(self, codebook):
+        # children[state] = [child for bit 0, child for bit 1]; a child is
+        # ('node', state) for internal nodes or ('leaf', value) for symbols
+        self.children = [[None, None]]
+        for value, code in codebook.items():
+            state = 0
+            for bit in code[:-1]:
+                child = self.children[state][int(bit)]
+                if child is None:
+                    self.children.append([None, None])
+                    child = ('node', len(self.children) - 1)
+                    self.children[state][int(bit)] = child
+                state = child[1]
+            self.children[state][int(code[-1])] = ('leaf', value)
+        self.rows = [None] * len(self.children)
+    
+    def row(self, state):
+        row = self.rows[state]
+        if row is None:
+            row = self.rows[state] = [self._walk(state, byte) for byte in range(256)]
+        return row
+    
+    def _walk(self, state, byte):
+        symbols = []
+        for k in range(7, -1, -1):
+            child = self.children[state][(byte >> k) & 1]
+            if child is None:
+                return -1, ()
+            kind, target = child
+            if kind == 'leaf':
+                symbols.append(target)
+                state = 0
+            else:
+                state = target
+        return state, tuple(symbols)
+
+
+@lru_cache(maxsize=128)
+def _dfa_for(code_length_items):
+    """Build (and memoize) the decoding automaton for a set of code lengths"""
+    return _HuffmanDFA(canonical_codebook(dict(code_length_items)))
+
+
+def huffman_decompress_bytes(data, bit_length, code_lengths, count):
+    """
+    Decompress packed canonical Huffman data one byte per step
+    
+    Each input byte is a single table lookup in the automaton built from
+    the code lengths, emitting every symbol completed inside that byte.
+    
+    Args:
+        data (bytes): Packed stream from huffman_compress_bytes
+        bit_length (int): Number of meaningful bits in data
+        code_lengths (dict): Mapping from values to code lengths
+        count (int): Number of values to decode
+        
+    Returns:
+        list: Decompressed list of integers
+        
+    Raises:
+        ValueError: If the data contains an invalid codeword
+    """
+    if not data or not code_lengths:
+        return []
+    
+    if len(code_lengths) > _MEMO_MAX_SYMBOLS:
+        dfa = _HuffmanDFA(canonical_codebook(code_lengths))
+    else:
+        dfa = _dfa_for(frozenset(code_lengths.items()))
+    numbers = []
+    state = 0
+    
+    for index in range(min(len(data), (bit_length + 7) // 8)):
+        state, symbols = dfa.row(state)[data[index]]
+        if state < 0:
+            raise ValueError(f"Invalid Huffman code in byte {index}")
+        numbers.extend(symbols)
+        if len(numbers) >= count:
+            break
+    
+    # Zero padding in the last byte may complete extra codewords
+    del numbers[count:]
+    return numbers
+
+
 def get_huffman_compression_info(numbers):
     """
     Get detailed information about Huffman compression
     
     Args:
-        numbers (list): List of integers
+        numbers (list or numpy.ndarray): Integers
         
     Returns:
         dict: Compression statistics and details
     """
-    if not numbers:
+    if len(numbers) == 0:
         return {
             'original_bits': 0,
             'compressed_bits': 0,
@@ -216,12 +612,11 @@ def get_huffman_compression_info(numbers):
         }
     
     # Calculate frequencies and build tree
-    frequencies = Counter(numbers)
-    root = build_huffman_tree(frequencies)
-    codebook = build_codebook(root)
+    frequencies = _count_frequencies(numbers)
+    codebook = get_codebook(frequencies)
     
-    # Compress
-    compressed = huffman_compress(numbers)
+    # Compress with the codebook we already have
+    compressed = _encode_with_codebook(numbers, codebook)
     
     # Calculate original size (32-bit integers as baseline)
     original_bits = len(numbers) * 32
@@ -232,7 +627,8 @@ def get_huffman_compression_info(numbers):
         'compressed_bits': compressed_bits,
         'compression_ratio': original_bits / compressed_bits if compressed_bits > 0 else 0,
         'savings_percentage': ((original_bits - compressed_bits) / original_bits * 100) if original_bits > 0 else 0,
-        'codebook': codebook,
+        'codebook': dict(codebook),
+        'code_lengths': get_code_lengths(codebook),
         'unique_values': len(frequencies),
         'frequencies': dict(frequencies)
     }
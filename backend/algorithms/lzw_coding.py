@@ -7,6 +7,144 @@ References:
 - Ziv, J., & Lempel, A. (1977). A universal algorithm for sequential data compression
 """
 
+from array import array
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the dict-based loop is used instead
+    njit = None
+
+# Powers of ten for digit counting; values up to 10**18 keep int64 headroom
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+# Inputs at least this long go through the JIT kernel when Numba is present
+_NB_MIN_SIZE = 256
+
+# Inputs using at most this many distinct bytes (e.g. digits and commas)
+# get a directly indexed phrase table instead of a hash table
+_NB_DIRECT_ALPHABET = 16
+
+
+# ================================================
+# OPTIONAL NUMBA KERNEL
+# ================================================
+
+if njit is not None:
+    @njit(cache=True)
+    def _lzw_compress_nb(data):
+        """
+        LZW over a uint8 array with an open-addressing phrase table
+        
+        Same dictionary semantics as lzw_compress (unbounded, keys are
+        (prefix_code << 8) | next_byte); the table holds at most
+        len(data) - 1 phrases and is sized to stay at most half full.
+        """
+        n = data.size
+        bits = 10
+        while (1 << bits) < 2 * n:
+            bits += 1
+        table_mask = (1 << bits) - 1
+        shift = np.uint64(64 - bits)
+        
+        keys = np.full(1 << bits, -1, dtype=np.int64)
+        values = np.empty(1 << bits, dtype=np.int32)
+        out = np.empty(n, dtype=np.int32)
+        
+        current = np.int64(data[0])
+        next_code = 256
+        count = 0
+        
+        for i in range(1, n):
+            byte = np.int64(data[i])
+            key = (current << 8) | byte
+            
+            # Fibonacci hashing, then linear probing
+            slot = np.int64((np.uint64(key) * np.uint64(11400714819323198485)) >> shift)
+            while keys[slot] != -1 and keys[slot] != key:
+                slot = (slot + 1) & table_mask
+            
+            if keys[slot] == key:
+                current = np.int64(values[slot])
+            else:
+                out[count] = current
+                count += 1
+                keys[slot] = key
+                values[slot] = next_code
+                next_code += 1
+                current = byte
+        
+        out[count] = current
+        return out[:count + 1]
+
+    @njit(cache=True)
+    def _lzw_compress_direct_nb(data, symbol_index, alphabet):
+        """
+        LZW over a uint8 array with a directly indexed phrase table
+        
+        For small alphabets the phrase (prefix_code, next_byte) lives at
+        prefix_code * alphabet + symbol_index[next_byte]: one load, no
+        hashing or probing. Rows are appended per code, so the table
+        doubles in place of rehashing when it fills up.
+        """
+        n = data.size
+        capacity = 256 + max(n // 8, 1024)
+        table = np.full(capacity * alphabet, -1, dtype=np.int32)
+        out = np.empty(n, dtype=np.int32)
+        
+        current = np.int64(data[0])
+        next_code = 256
+        count = 0
+        
+        for i in range(1, n):
+            byte = data[i]
+            slot = current * alphabet + symbol_index[byte]
+            code = table[slot]
+            
+            if code != -1:
+                current = np.int64(code)
+            else:
+                out[count] = current
+                count += 1
+                
+                if next_code >= capacity:
+                    grown = np.full(2 * capacity * alphabet, -1, dtype=np.int32)
+                    grown[:capacity * alphabet] = table
+                    table = grown
+                    capacity *= 2
+                
+                table[slot] = next_code
+                next_code += 1
+                current = np.int64(byte)
+        
+        out[count] = current
+        return out[:count + 1]
+else:
+    _lzw_compress_nb = None
+    _lzw_compress_direct_nb = None
+
+
+def _lzw_compress_jit(data):
+    """
+    Run the Numba LZW kernel best suited to the input's alphabet
+    
+    Args:
+        data (bytes): Input of at least one byte
+        
+    Returns:
+        numpy.ndarray: int32 codes, identical to the dict-based loop
+    """
+    data = np.frombuffer(data, dtype=np.uint8)
+    present = np.flatnonzero(np.bincount(data, minlength=256))
+    
+    if present.size > _NB_DIRECT_ALPHABET:
+        return _lzw_compress_nb(data)
+    
+    symbol_index = np.zeros(256, dtype=np.int64)
+    symbol_index[present] = np.arange(present.size)
+    return _lzw_compress_direct_nb(data, symbol_index, present.size)
+
 
 def lzw_compress(data):
     """
@@ -19,48 +157,59 @@ def lzw_compress(data):
     4. Continue until all input is processed
     
     Args:
-        data (str): String data to compress
+        data (str or bytes): Data to compress. Strings are encoded as
+            Latin-1 (one byte per character 0-255).
         
     Returns:
-        list: List of integer codes representing compressed data
+        array: array('i') of integer codes representing compressed data
         
     Example:
-        >>> lzw_compress("ABABABA")
+        >>> lzw_compress("ABABABA").tolist()
         [65, 66, 256, 258, 65]
     """
     if not data:
-        return []
-    
-    # Initialize dictionary with single characters
-    # ASCII values 0-255 are reserved for single characters
-    dictionary = {chr(i): i for i in range(256)}
+        return array('i')
+    
+    # Codes 0-255 are the single bytes themselves, so the dictionary only
+    # holds learned phrases, keyed by (prefix_code << 8) | next_byte.
+    # The current phrase is tracked by its code: no string is built.
+    # Latin-1 maps each character 0-255 to the byte of the same value,
+    # keeping codes identical to the character-based dictionary.
+    if isinstance(data, str):
+        data = data.encode('latin-1')
+    
+    if _lzw_compress_nb is not None and len(data) >= _NB_MIN_SIZE:
+        codes = _lzw_compress_jit(data)
+        return array('i', codes.astype(np.intc, copy=False).tobytes())
+    
+    data = memoryview(data).cast('B')
+    dictionary = {}
     next_code = 256
     
-    # Current string being processed
-    current = ""
-    result = []
+    current = data[0]
+    result = array('i')
     
-    for char in data:
-        combined = current + char
+    for byte in data[1:]:
+        key = (current << 8) | byte
+        code = dictionary.get(key)
         
-        if combined in dictionary:
+        if code is not None:
             # Pattern exists in dictionary, continue building
-            current = combined
+            current = code
         else:
             # Pattern not in dictionary
             # Output code for current pattern
-            result.append(dictionary[current])
+            result.append(current)
             
             # Add new pattern to dictionary
-            dictionary[combined] = next_code
+            dictionary[key] = next_code
             next_code += 1
             
-            # Start new pattern with current character
-            current = char
+            # Start new pattern with current byte
+            current = byte
     
     # Output code for remaining pattern
-    if current:
-        result.append(dictionary[current])
+    result.append(current)
     
     return result
 
@@ -106,6 +255,55 @@ def lzw_decompress(codes):
     return ''.join(result)
 
 
+def numbers_to_ascii(numbers):
+    """
+    Serialize integers as comma-separated ASCII bytes
+    
+    Non-negative int64 data is formatted column-wise in NumPy: every
+    number's digits are written into a fixed-width byte matrix by repeated
+    divmod, then the left padding is masked out. This produces exactly
+    ','.join(map(str, numbers)) without a str object per number (bools
+    mixed into a list are written as 0/1). Negative or oversized values
+    use the join.
+    
+    Args:
+        numbers (list or numpy.ndarray): Integers to serialize
+        
+    Returns:
+        bytes: ASCII text such as b'1,2,3'
+        
+    Example:
+        >>> numbers_to_ascii([1, 20, 300])
+        b'1,20,300'
+    """
+    arr = None
+    if len(numbers) > 0:
+        try:
+            arr = np.asarray(numbers)
+        except (ValueError, OverflowError):
+            arr = None
+    
+    if (arr is None or arr.ndim != 1 or arr.dtype.kind not in 'iu'
+            or arr.min() < 0 or arr.max() >= _POW10[-1]):
+        return ','.join(map(str, numbers)).encode('ascii')
+    
+    arr = arr.astype(np.int64, copy=False)
+    digits = np.maximum(np.searchsorted(_POW10, arr, side='right'), 1)
+    width = int(digits.max())
+    
+    # Right-aligned digits, one row per number, plus a trailing comma column
+    out = np.empty((arr.size, width + 1), dtype=np.uint8)
+    out[:, width] = ord(',')
+    rest = arr.copy()
+    for col in range(width - 1, -1, -1):
+        np.remainder(rest, 10, out=out[:, col], casting='unsafe')
+        rest //= 10
+    out[:, :width] += ord('0')
+    
+    keep = np.arange(width + 1) >= (width - digits)[:, None]
+    return out[keep].tobytes()[:-1]
+
+
 def lzw_compress_numbers(numbers):
     """
     Compress a list of numbers using LZW
@@ -117,16 +315,16 @@ def lzw_compress_numbers(numbers):
         numbers (list): List of integers
         
     Returns:
-        list: List of LZW codes
+        array: array('i') of LZW codes
     """
-    if not numbers:
-        return []
+    if len(numbers) == 0:
+        return array('i')
     
-    # Convert numbers to string
-    data_string = ','.join(map(str, numbers))
+    # Convert numbers to comma-separated ASCII bytes
+    data = numbers_to_ascii(numbers)
     
     # Apply LZW compression
-    return lzw_compress(data_string)
+    return lzw_compress(data)
 
 
 def lzw_decompress_numbers(codes):
@@ -158,12 +356,12 @@ def get_lzw_compression_info(numbers):
     Get detailed information about LZW compression
     
     Args:
-        numbers (list): List of integers
+        numbers (list or numpy.ndarray): Integers
         
     Returns:
         dict: Compression statistics
     """
-    if not numbers:
+    if len(numbers) == 0:
         return {
             'original_bits': 0,
             'compressed_bits': 0,
@@ -191,22 +389,24 @@ def get_lzw_compression_info(numbers):
     }
 
 
-def convert_lzw_to_binary(codes):
+def convert_lzw_to_bytes(codes):
     """
-    Convert LZW codes to binary string for fair comparison
+    Bit-pack LZW codes using variable-length encoding
     
-    Uses variable-length encoding based on dictionary size
+    Codes start at 9 bits and the width grows whenever a code no longer
+    fits. Bits are shifted into an integer accumulator and whole bytes
+    are flushed as they fill, MSB first; the last byte is zero-padded.
     
     Args:
         codes (list): List of LZW codes
         
     Returns:
-        str: Binary string representation
+        tuple: (bytes, bit_length) - packed codes and their length in bits
     """
-    if not codes:
-        return ''
-    
-    binary_parts = []
+    out = bytearray()
+    acc = 0
+    nbits = 0
+    total_bits = 0
     
     # Start with 9 bits (256 initial codes + need for growth)
     current_bits = 9
@@ -218,11 +418,41 @@ def convert_lzw_to_binary(codes):
             current_bits += 1
             max_code = (1 << current_bits) - 1
         
-        # Convert code to binary with current bit width
-        binary = format(code, f'0{current_bits}b')
-        binary_parts.append(binary)
+        acc = (acc << current_bits) | code
+        nbits += current_bits
+        total_bits += current_bits
+        
+        # Flush whole bytes and keep only the pending bits
+        while nbits >= 8:
+            nbits -= 8
+            out.append((acc >> nbits) & 0xFF)
+        acc &= (1 << nbits) - 1
+    
+    if nbits:
+        out.append((acc << (8 - nbits)) & 0xFF)
+    
+    return bytes(out), total_bits
+
+
+def convert_lzw_to_binary(codes):
+    """
+    Convert LZW codes to binary string for fair comparison
+    
+    Uses variable-length encoding based on dictionary size
+    (see convert_lzw_to_bytes); the packed bytes are rendered as a
+    '0'/'1' string in a single conversion.
+    
+    Args:
+        codes (list): List of LZW codes
+        
+    Returns:
+        str: Binary string representation
+    """
+    if not codes:
+        return ''
     
-    return ''.join(binary_parts)
+    packed, bit_length = convert_lzw_to_bytes(codes)
+    return format(int.from_bytes(packed, 'big'), f'0{len(packed) * 8}b')[:bit_length]
 
 
 # ================================================
@@ -239,7 +469,7 @@ def test_lzw_coding():
     compressed = lzw_compress(test_string)
     decompressed = lzw_decompress(compressed)
     print(f"   Original:      {test_string}")
-    print(f"   Compressed:    {compressed}")
+    print(f"   Compressed:    {compressed.tolist()}")
     print(f"   Decompressed:  {decompressed}")
     print(f"   Match: {'✓' if test_string == decompressed else '✗'}")
     
@@ -249,7 +479,7 @@ def test_lzw_coding():
     compressed_nums = lzw_compress_numbers(test_numbers)
     decompressed_nums = lzw_decompress_numbers(compressed_nums)
     print(f"   Original:      {test_numbers}")
-    print(f"   Compressed:    {compressed_nums}")
+    print(f"   Compressed:    {compressed_nums.tolist()}")
     print(f"   Decompressed:  {decompressed_nums}")
     print(f"   Match: {'✓' if test_numbers == decompressed_nums else '✗'}")
     
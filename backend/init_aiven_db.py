@@ -62,7 +62,8 @@ try:
             id INT AUTO_INCREMENT PRIMARY KEY,
             user_id INT NULL,
             raw_input TEXT NOT NULL,
-            compressed_data MEDIUMTEXT NOT NULL,
+            compressed_data MEDIUMBLOB NOT NULL,
+            compressed_bits INT NULL,
             time_taken DECIMAL(10, 6) NOT NULL,
             compression_ratio VARCHAR(50) NOT NULL,
             size_reduction VARCHAR(50) NOT NULL,
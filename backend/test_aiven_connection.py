@@ -5,6 +5,7 @@ Quick script to verify your Aiven MySQL credentials work
 """
 
 import mysql.connector
+from mysql.connector.constants import ClientFlag
 from dotenv import load_dotenv
 import os
 
@@ -39,28 +40,31 @@ try:
         user=MYSQL_USER,
         password=MYSQL_PASSWORD,
         database=MYSQL_DATABASE,
-        ssl_disabled=not ssl_required
+        ssl_disabled=not ssl_required,
+        client_flags=[ClientFlag.MULTI_STATEMENTS],
+        connection_timeout=3  # fail fast on a wrong host or firewalled port
     )
     
     print("✓ Connection successful!\n")
     
-    # Test query
+    # Run all three checks in one round trip (one result set per statement)
     cursor = conn.cursor()
-    cursor.execute("SELECT VERSION()")
-    version = cursor.fetchone()
+    version_rows, databases, tables = [
+        result.fetchall()
+        for result in cursor.execute("SELECT VERSION(); SHOW DATABASES; SHOW TABLES", multi=True)
+    ]
+    
+    # Test query
+    version = version_rows[0]
     print(f"MySQL Version: {version[0]}")
     
     # Show databases
-    cursor.execute("SHOW DATABASES")
-    databases = cursor.fetchall()
     print(f"\nAvailable databases ({len(databases)}):")
     for db in databases:
         marker = "←" if db[0] == MYSQL_DATABASE else ""
         print(f"  - {db[0]} {marker}")
     
     # Check if tables exist
-    cursor.execute("SHOW TABLES")
-    tables = cursor.fetchall()
     print(f"\nTables in '{MYSQL_DATABASE}' ({len(tables)}):")
     if tables:
         for table in tables:
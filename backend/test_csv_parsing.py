@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test CSV Parsing
+Quick script to check that the NumPy fast path in parse_integer_csv agrees
+with the csv.reader path on every input it accepts
+"""
+
+import sys
+
+CASES = [
+    ("plain numbers", b"1,2,3\n4,5\n", [1, 2, 3, 4, 5]),
+    ("text header", b"id,value\n1,2\n3,4\n", [1, 2, 3, 4]),
+    ("numeric header", b"5,x\n1,2\n", None),
+    ("quoted numeric header", b'"5",x\n1,2\n', [5, 1, 2]),
+    ("quoted text header", b'"id","value"\n1,2\n', [1, 2]),
+    ("CRLF line endings", b"value\r\n1\r\n2\r\n", [1, 2]),
+    ("header with bare CR", b"id\r5\n1,2\n", [5, 1, 2]),
+    ("padded header cell", b"x, 7\n1\n", [7, 1]),
+    ("zeros dropped", b"0,1,0,2\n", [1, 2]),
+    ("empty file", b"", []),
+]
+
+
+def main():
+    """Run every case through both parsers; returns the number of failures"""
+    # Importing app connects the MySQL pool and starts the warm-up thread,
+    # so it happens only when the script is run, not when it is collected
+    from app import parse_integer_csv, parse_csv_cells
+    
+    print("=" * 60)
+    print("Testing CSV Parsing")
+    print("=" * 60)
+    
+    failures = 0
+    for name, raw, expected in CASES:
+        reference = parse_csv_cells(raw)
+        fast = parse_integer_csv(raw)
+        result = reference if fast is None else fast.tolist()
+    
+        ok = result == reference and (expected is None or result == expected)
+        failures += not ok
+        path = "reader" if fast is None else "fast"
+        print(f"{'✓' if ok else '✗'} {name:<24} [{path:>6}] {result}"
+              f"{'' if ok else f' (reader: {reference}, expected: {expected})'}")
+    
+    print("=" * 60)
+    print("All CSV parsing checks passed!" if not failures else f"{failures} CSV parsing check(s) failed")
+    return failures
+
+
+if __name__ == '__main__':
+    sys.exit(1 if main() else 0)